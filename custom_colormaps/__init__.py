@@ -14,12 +14,24 @@ Notes
 * 20150724 -- Attempted to make this more Pythonic
 * 20180307 -- Changed license to BSD 3-clause
 * 20240325 -- Added breakpoint colormap generator
+* 20261015 -- Added batch colormap generator
+
+matplotlib is imported on first use to keep importing this module light.
+ColorConverter and LinearSegmentedColormap are still available as module
+attributes. The LinearSegmentedColormap return annotations resolve only
+under type checking, so typing.get_type_hints raises NameError for them.
 """
+from __future__ import annotations
 import ast
-from typing import Optional, Union, Sequence
+import functools
+from typing import TYPE_CHECKING, Optional, Union, Sequence
 from typing_extensions import TypeAlias
 import numpy as np
-from matplotlib.colors import ColorConverter, LinearSegmentedColormap
+
+if TYPE_CHECKING:
+    # matplotlib is imported on first use (see _get_mpl) to keep the
+    # import light
+    from matplotlib.colors import LinearSegmentedColormap
 
 Number = Union[int, float, np.integer, np.floating]
 RGBType: TypeAlias = tuple[float, float, float]
@@ -27,6 +39,31 @@ __version__ = "2.0"
 __author__ = "Chris Slocum"
 
 
+@functools.lru_cache(maxsize=None)
+def _get_mpl():
+    """Import matplotlib.colors once, on first use."""
+    import matplotlib.colors
+    return matplotlib.colors
+
+
+def __getattr__(name: str):
+    """Resolve the matplotlib.colors names this module used to import."""
+    if name in ('ColorConverter', 'LinearSegmentedColormap'):
+        return getattr(_get_mpl(), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _to_rgb(color) -> RGBType:
+    """Convert a color to RGB with matplotlib."""
+    return _get_mpl().to_rgb(color)
+
+
+@functools.lru_cache(maxsize=512)
+def _cached_to_rgb(color: str) -> RGBType:
+    """Convert a color string to RGB, caching repeated names and codes."""
+    return _to_rgb(color)
+
+
 def normalize(value: Union[Number, np.ndarray], vmin: Number,
               vmax: Number) -> Union[Number, np.ndarray]:
     """
@@ -56,6 +93,12 @@ def normalize(value: Union[Number, np.ndarray], vmin: Number,
     #if vmax is None:
     #    vmax = np.max(value)
     diff = float(vmax - vmin)
+    if isinstance(value, np.ndarray):
+        # single temporary for the whole array, keeping float precision
+        dtype = value.dtype if value.dtype.kind == 'f' else np.float64
+        norm = np.subtract(value, vmin, dtype=dtype)
+        norm /= diff
+        return norm
     norm = (value - vmin) / diff
     return norm
 
@@ -67,7 +110,10 @@ def convert_color(color: Union[str, Sequence, np.ndarray]) -> RGBType:
     Parameters
     ----------
     color : str or array-like
-        Color representation
+        Color representation. RGB ndarrays are assumed to be [0..255]
+        for integers and [0..1] for floats. RGB lists and tuples are
+        assumed to be [0..255] if any element is greater than 1 and
+        [0..1] otherwise.
 
     Returns
     -------
@@ -90,40 +136,121 @@ def convert_color(color: Union[str, Sequence, np.ndarray]) -> RGBType:
         """
         if np.issubdtype(color.dtype, np.integer):
             color = color / 255.
-        ccolor = ColorConverter().to_rgb(color)
+        ccolor = _to_rgb(color)
         return ccolor
 
-    def covert_color_sequence(color: Sequence) -> RGBType:
+    def covert_color_sequence(color: np.ndarray) -> RGBType:
         """
-        Convert color tuple to matplotlib RGB [0..1].
+        Convert 8-bit color sequence to matplotlib RGB [0..1].
 
         Parameters
         ----------
-        ccolor : list or tuple
-            RGB array color
+        ccolor : numpy.ndarray
+            RGB array color from a list or tuple
 
         Returns
         -------
         color : tuple
             matplotlib RGB [0..1]
         """
-        ccolor = tuple(elem / 255. for elem in color)
+        ccolor = tuple((color / 255.).tolist())
         return ccolor
 
+    is_numeric = is_bit = False
+    if isinstance(color, (tuple, list)):
+        color_array = np.asarray(color)
+        is_numeric = color_array.dtype.kind in 'iuf' and \
+            color_array.shape == (3,)
+        is_bit = color_array.dtype.kind in 'iuf' and \
+            bool((color_array > 1).any())
     if isinstance(color, np.ndarray):
         ccolor = covert_color_array(color)
-    elif isinstance(color, (tuple, list)) and \
-            any(isinstance(elem, int) and elem > 1 for elem in color):
-        ccolor = covert_color_sequence(color)
+    elif is_bit:
+        ccolor = covert_color_sequence(color_array)
+    elif is_numeric and bool((color_array >= 0).all()):
+        # already matplotlib RGB [0..1]
+        ccolor = tuple(color_array.astype(np.float64).tolist())
+    elif isinstance(color, (tuple, list)):
+        # matplotlib validates RGBA tuples directly
+        ccolor = _to_rgb(tuple(color))
     else:
+        color = str(color)
         try:
-            ccolor = ColorConverter().to_rgb(str(color))
+            ccolor = _cached_to_rgb(color)
         except ValueError:
-            # Allow for tuples as well as string representations
-            ccolor = ColorConverter().to_rgb(ast.literal_eval(str(color)))
+            # Allow for string representations of tuples
+            ccolor = _to_rgb(ast.literal_eval(color))
     return ccolor
 
 
+def convert_color_array(colors: Union[Sequence, np.ndarray]) -> np.ndarray:
+    """
+    Convert an array of numeric RGB colors to RGB [0..1].
+
+    Parameters
+    ----------
+    colors : array-like
+        Sequence of RGB colors or an (N, 3) array. Integer ndarrays,
+        either the whole array or individual colors, are assumed to be
+        [0..255] and float ndarrays [0..1]. A list or tuple color is
+        assumed to be [0..255] if any element is greater than 1.
+
+    Returns
+    -------
+    rgb : numpy.ndarray
+        (N, 3) float32 array of matplotlib RGB [0..1]
+
+    Raises
+    ------
+    ValueError
+        If the colors are not RGB(A) or are outside [0..1] after scaling
+    """
+    rgb = np.array(colors, dtype=np.float32)
+    if rgb.ndim != 2 or rgb.shape[1] not in (3, 4):
+        raise ValueError("colors must be a sequence of RGB values")
+    # drop alpha as ColorConverter.to_rgb does
+    rgb = rgb[:, :3]
+    if isinstance(colors, np.ndarray):
+        # ndarrays follow their dtype as in convert_color
+        if np.issubdtype(colors.dtype, np.integer):
+            rgb /= 255.
+    else:
+        bit = np.any(rgb > 1, axis=1)
+        for k, color in enumerate(colors):
+            if isinstance(color, np.ndarray):
+                bit[k] = np.issubdtype(color.dtype, np.integer)
+        if bit.any():
+            # scale the 8-bit rows in place without a gather/scatter copy
+            np.divide(rgb, 255., out=rgb, where=bit[:, np.newaxis])
+    if (rgb < 0).any() or (rgb > 1).any():
+        raise ValueError("RGB values must be in the range [0..1] or [0..255]")
+    return rgb
+
+
+def _convert_colors(colors: Union[Sequence, np.ndarray]) -> np.ndarray:
+    """Convert colors to an (N, 3) array of RGB [0..1]."""
+    if isinstance(colors, np.ndarray):
+        if colors.dtype.kind in 'iuf' and colors.ndim == 2:
+            return convert_color_array(colors)
+    elif all(isinstance(color, (tuple, list, np.ndarray))
+             for color in colors):
+        try:
+            return convert_color_array(colors)
+        except ValueError:
+            # e.g., mixed RGB and RGBA or non-numeric elements
+            pass
+    if all(isinstance(color, str) for color in colors):
+        try:
+            rgba = _get_mpl().to_rgba_array(colors)
+            return rgba[:, :3].astype(np.float32)
+        except ValueError:
+            # e.g., string representations of tuples
+            pass
+    # Fall back to per-color conversion for mixed colors
+    return np.array([convert_color(color) for color in colors],
+                    dtype=np.float32)
+
+
 def create_colormap(colors: Union[Sequence, np.ndarray],
                     position: Optional[Union[Sequence, np.ndarray]] = None,
                     reverse: bool = False,
@@ -136,8 +263,9 @@ def create_colormap(colors: Union[Sequence, np.ndarray],
     colors : array-like
         An array-like object of colors corresponding to each postion
         element. Colors can be defined as HEX code, color names, or RGB
-        values. RGB data assumes data types are floats for [0..1] or
-        integers for [0..255].
+        values. RGB ndarrays are assumed to be [0..255] for integers and
+        [0..1] for floats. RGB lists and tuples are assumed to be
+        [0..255] if any element is greater than 1 and [0..1] otherwise.
     position : array-like, optional
         A list of monotonic position values corresponding to each color.
         If None, linear spacing is assumed.
@@ -151,30 +279,183 @@ def create_colormap(colors: Union[Sequence, np.ndarray],
     cmap : matplotlib.colors.LinearSegmentedColormap
         matplotlib colormap instance
     """
-    if reverse:
-        colors = colors[::-1]
+    key = _cache_key(colors, position, reverse, name)
+    if key is None:
+        return _create_colormap(colors, position, reverse, name)
+    cached = _COLORMAP_CACHE.pop(key, None)
+    if cached is None:
+        cmap = _create_colormap(colors, position, reverse, name)
+        cached = cmap._segmentdata  # type: ignore[attr-defined]
+        if len(_COLORMAP_CACHE) >= _COLORMAP_CACHE_SIZE:
+            # drop the least recently used colormap
+            del _COLORMAP_CACHE[next(iter(_COLORMAP_CACHE))]
+    # (re)insert as the most recently used colormap
+    _COLORMAP_CACHE[key] = cached
+    # new colormap with its own segmentdata so changes (e.g., set_bad or
+    # editing _segmentdata) do not leak into the cache
+    segmentdata = {channel: rows.copy() for channel, rows in cached.items()}
+    cmap = _get_mpl().LinearSegmentedColormap(name, segmentdata)
+    return cmap
+
+
+# segmentdata of recently built colormaps, oldest first
+_COLORMAP_CACHE: dict = {}
+_COLORMAP_CACHE_SIZE = 128
+# larger palettes are built without the cache to bound its memory
+_COLORMAP_CACHE_MAX_COLORS = 256
+
+
+def _cache_key(colors: Union[Sequence, np.ndarray],
+               position: Optional[Union[Sequence, np.ndarray]],
+               reverse: bool, name: str) -> Optional[tuple]:
+    """Return a hashable create_colormap key or None if not cacheable."""
+    try:
+        if len(colors) > _COLORMAP_CACHE_MAX_COLORS:
+            return None
+        key = (_hashable(colors), _hashable(position), reverse, name)
+        hash(key)
+    except TypeError:
+        # e.g., unhashable colors or object arrays
+        return None
+    return key
+
+
+def _hashable(value):
+    """Convert nested sequences and arrays to a hashable equivalent."""
+    if isinstance(value, np.ndarray):
+        if value.dtype.kind == 'O':
+            # the bytes are pointers, so the contents could change
+            raise TypeError("object arrays are not hashable")
+        # dtype matters as integer arrays are treated as 8-bit RGB
+        return (value.dtype.str, value.shape, value.tobytes())
+    if isinstance(value, (tuple, list)):
+        # flat colors (e.g., RGB tuples) are hashed in C; hash() rejects
+        # any unhashable contents
+        return tuple(elem if type(elem) is tuple else
+                     tuple(elem) if type(elem) is list else _hashable(elem)
+                     for elem in value)
+    return value
+
+
+def _create_colormap(colors: Union[Sequence, np.ndarray],
+                     position: Optional[Union[Sequence, np.ndarray]],
+                     reverse: bool, name: str) -> LinearSegmentedColormap:
+    """Build a linear custom colormap (see create_colormap)."""
+    return _colormap_from_rgb(_convert_colors(colors), position, reverse,
+                              name)
+
+
+def _colormap_from_rgb(rgb: np.ndarray,
+                       position: Optional[Union[Sequence, np.ndarray]],
+                       reverse: bool, name: str) -> LinearSegmentedColormap:
+    """Build a linear custom colormap from converted (N, 3) RGB."""
+    if position is None and not reverse:
+        return _create_colormap_default(rgb, name)
+    return _create_colormap_full(rgb, position, reverse, name)
+
+
+def _create_colormap_default(rgb: np.ndarray,
+                             name: str) -> LinearSegmentedColormap:
+    """Build a linear custom colormap with evenly spaced colors."""
+    x = np.linspace(0, 1, len(rgb))
+    return _get_mpl().LinearSegmentedColormap(name,
+                                              _linear_segmentdata(x, rgb))
+
+
+def _create_colormap_full(rgb: np.ndarray,
+                          position: Optional[Union[Sequence, np.ndarray]],
+                          reverse: bool,
+                          name: str) -> LinearSegmentedColormap:
+    """Build a linear custom colormap from all create_colormap options."""
     if position is None:
-        position = np.linspace(0, 1, len(colors))
-    if len(position) != len(colors):
+        position = np.linspace(0, 1, len(rgb))
+    position = np.asarray(position, dtype=np.float64)
+    if len(position) != len(rgb):
         raise ValueError("position length must be the same as colors")
-    # get the max/min values from positions
-    vmin = np.min(position)
-    vmax = np.max(position)
-    # check position order
-    if np.isclose(position[0], vmax):
-        colors = colors[::-1]
-        position = position[::-1]
-    segmentdata: dict = {'red': [], 'green': [], 'blue': []}
-    for pos, color in zip(position, colors):
-        x = normalize(pos, vmin, vmax)
-        ccolor = convert_color(color)
-        segmentdata['red'].append((x, ccolor[0], ccolor[0]))
-        segmentdata['green'].append((x, ccolor[1], ccolor[1]))
-        segmentdata['blue'].append((x, ccolor[2], ccolor[2]))
-    cmap = LinearSegmentedColormap(name, segmentdata)
+    # get the max/min values from positions, which are monotonic so the
+    # extremes are the end points
+    vmin, vmax = sorted((position[0], position[-1]))
+    # check position order; decreasing positions flip both arrays while
+    # reverse only flips the colors, so flip each at most once
+    decreasing = np.isclose(position[0], vmax)
+    if reverse != decreasing:
+        rgb = rgb[::-1]
+    if vmin == 0. and vmax == 1.:
+        # already normalized, e.g., the default linear spacing
+        x = position
+    else:
+        x = np.asarray(normalize(position, vmin, vmax))
+    if decreasing:
+        x = x[::-1]
+    cmap = _get_mpl().LinearSegmentedColormap(name,
+                                              _linear_segmentdata(x, rgb))
     return cmap
 
 
+def _linear_segmentdata(x: np.ndarray, rgb: np.ndarray) -> dict:
+    """Build continuous segmentdata from positions and (N, 3) RGB."""
+    segmentdata = {}
+    for k, channel in enumerate(('red', 'green', 'blue')):
+        rows = np.empty((len(x), 3), dtype=np.float32)
+        rows[:, 0] = x
+        rows[:, 1] = rgb[:, k]
+        rows[:, 2] = rgb[:, k]
+        segmentdata[channel] = rows
+    return segmentdata
+
+
+def create_colormaps(
+        colors: Sequence[Union[Sequence, np.ndarray]],
+        position: Optional[Sequence[Optional[Union[Sequence,
+                                                   np.ndarray]]]] = None,
+        reverse: bool = False,
+        name: Union[str, Sequence[str]] = 'custom_colormap'
+) -> list[LinearSegmentedColormap]:
+    """
+    Returns a list of linear custom colormaps.
+
+    Parameters
+    ----------
+    colors : sequence of array-like
+        One array-like object of colors per colormap as described in
+        create_colormap.
+    position : sequence of array-like, optional
+        One list of monotonic position values (or None for linear spacing)
+        per colormap. If None, linear spacing is assumed for all colormaps.
+    reverse : Boolean, default=False
+        If you want to flip the colormaps
+    name : string or sequence of strings, default='custom_colormap'
+        Name of each colormap. A single string is used as a prefix
+        followed by the index of the colormap.
+
+    Returns
+    -------
+    cmaps : list of matplotlib.colors.LinearSegmentedColormap
+        matplotlib colormap instances
+    """
+    if len(colors) == 0:
+        return []
+    if position is None:
+        position = [None] * len(colors)
+    if isinstance(name, str):
+        name = [f'{name}_{k}' for k in range(len(colors))]
+    if len(position) != len(colors):
+        raise ValueError("position length must be the same as colors")
+    if len(name) != len(colors):
+        raise ValueError("name length must be the same as colors")
+    if any(isinstance(palette, np.ndarray) for palette in colors):
+        # arrays keep their own integer dtype handling
+        rgbs = [_convert_colors(palette) for palette in colors]
+    else:
+        # convert the colors of every colormap in one pass
+        flat = [color for palette in colors for color in palette]
+        offsets = np.cumsum([len(palette) for palette in colors])[:-1]
+        rgbs = np.split(_convert_colors(flat), offsets)
+    cmaps = [_colormap_from_rgb(rgb, pos, reverse, cname)
+             for rgb, pos, cname in zip(rgbs, position, name)]
+    return cmaps
+
+
 def create_breakpoint_colormap(
         colors: Union[Sequence, np.ndarray],
         position: Optional[Union[Sequence, np.ndarray]] = None,
@@ -187,8 +468,9 @@ def create_breakpoint_colormap(
     colors : array-like
         An array-like object of color pairs corresponding to each postion
         element. Colors can be defined as HEX code, color names, or RGB
-        values. RGB data assumes data types are floats for [0..1] or
-        integers for [0..255].
+        values. RGB ndarrays are assumed to be [0..255] for integers and
+        [0..1] for floats. RGB lists and tuples are assumed to be
+        [0..255] if any element is greater than 1 and [0..1] otherwise.
     position : array-like, optional
         A list of monotonic position start-stop pairs corresponding to each
         color pair. If None, linear spacing is assumed.
@@ -212,30 +494,37 @@ def create_breakpoint_colormap(
         raise ValueError("Each element in position must have a length of 2")
     if any(len(elem) != 2 for elem in colors):
         raise ValueError("Each element in colors must have a length of 2")
-    # get the max/min values from position
-    vmin = np.min(position)
-    vmax = np.max(position)
+    position = np.asarray(position, dtype=np.float64)
+    # get the max/min values from position, which are monotonic so the
+    # extremes are the end points
+    vmin, vmax = sorted((position[0, 0], position[-1, 1]))
     # check position order
     if np.isclose(position[0][0], vmax):
         raise ValueError("position must increase")
+    # y1 starts each segment and y0 ends the previous one.
     # Note y0 in the first row and y1 in the last row are never used.
-    y0 = (0.0, 0.0, 0.0)
-    y1 = (1.0, 1.0, 1.0)
+    endpoints: Union[Sequence, np.ndarray]
+    if isinstance(colors, np.ndarray):
+        # flatten the pairs, keeping any RGB axis
+        endpoints = colors.reshape(-1, *colors.shape[2:])
+    else:
+        endpoints = [color for pair in colors for color in pair]
+    # convert every start and stop color in one pass
+    rgb = _convert_colors(endpoints)
+    y1 = rgb[0::2]
+    y0 = rgb[1::2]
+    x = np.append(position[:, 0], position[-1, 1])
+    if vmin != 0. or vmax != 1.:
+        x = np.asarray(normalize(x, vmin, vmax))
     # color dictionary for LinearSegmentedColormap
-    segmentdata: dict = {'red': [], 'green': [], 'blue': []}
-    for pos, color in zip(position, colors):
-        pos_start = pos[0]
-        y1 = convert_color(color[0])
-        x = normalize(pos_start, vmin, vmax)
-        segmentdata['red'].append((x, y0[0], y1[0]))
-        segmentdata['green'].append((x, y0[1], y1[1]))
-        segmentdata['blue'].append((x, y0[2], y1[2]))
-        # Update y0
-        pos_stop = pos[1]
-        y0 = convert_color(color[1])
-    x = normalize(pos_stop, vmin, vmax)
-    segmentdata['red'].append((x, y0[0], y1[0]))
-    segmentdata['green'].append((x, y0[1], y1[1]))
-    segmentdata['blue'].append((x, y0[2], y1[2]))
-    cmap = LinearSegmentedColormap(name, segmentdata)
+    segmentdata = {}
+    for k, channel in enumerate(('red', 'green', 'blue')):
+        rows = np.empty((len(x), 3), dtype=np.float32)
+        rows[:, 0] = x
+        rows[0, 1] = 0.0
+        rows[1:, 1] = y0[:, k]
+        rows[:-1, 2] = y1[:, k]
+        rows[-1, 2] = 1.0
+        segmentdata[channel] = rows
+    cmap = _get_mpl().LinearSegmentedColormap(name, segmentdata)
     return cmap
@@ -0,0 +1,158 @@
+"""Regression tests for custom_colormaps."""
+import weakref
+import numpy as np
+import pytest
+import custom_colormaps
+from custom_colormaps import (convert_color, create_breakpoint_colormap,
+                              create_colormap, create_colormaps, normalize)
+
+BLUE = (0., 0., 1.)
+WHITE = (1., 1., 1.)
+RED = (1., 0., 0.)
+
+
+def assert_colors(cmap, expected):
+    """Check the colors at evenly spaced points along the colormap."""
+    rgba = cmap.resampled(len(expected))(np.arange(len(expected)))
+    np.testing.assert_allclose(rgba[:, :3], expected, atol=1e-6)
+
+
+@pytest.mark.parametrize('colors, expected', [
+    (['blue', 'white', 'red'], [BLUE, WHITE, RED]),
+    (np.array(['blue', 'white', 'red']), [BLUE, WHITE, RED]),
+    (np.array([(0, 0, 1), 'white', '#ff0000'], dtype=object),
+     [BLUE, WHITE, RED]),
+    ([(0, 0, 1), (1, 1, 1, 0.5), (1, 0, 0)], [BLUE, WHITE, RED]),
+    ([(0, 0, 255), (255, 255, 255), (255, 0, 0)], [BLUE, WHITE, RED]),
+    (np.array([(0, 0, 255), (255, 255, 255), (255, 0, 0)]),
+     [BLUE, WHITE, RED]),
+    ([np.array([0, 0, 255]), np.array([1, 1, 1]), (1, 0, 0)],
+     [BLUE, (1 / 255, 1 / 255, 1 / 255), RED]),
+    ([(0, 0, 1), (1, 1, 1), (1., 0., 0.)], [BLUE, WHITE, RED]),
+    ([(0, 0, 1), 'white', '(1.0, 0.0, 0.0)'], [BLUE, WHITE, RED]),
+    (np.array([0., 0.5, 1.]), [(0., 0., 0.), (0.5, 0.5, 0.5), WHITE]),
+    ([0., 0.5, 1.], [(0., 0., 0.), (0.5, 0.5, 0.5), WHITE]),
+])
+def test_create_colormap_inputs(colors, expected):
+    assert_colors(create_colormap(colors), expected)
+
+
+@pytest.mark.parametrize('colors', [
+    np.array([(255., 0., 0.), (0., 0., 255.)]),
+    [np.array([255., 0., 0.]), (0, 0, 255)],
+])
+def test_float_ndarray_not_8bit(colors):
+    with pytest.raises(ValueError):
+        create_colormap(colors)
+    with pytest.raises(ValueError):
+        convert_color(colors[0])
+
+
+def test_sequence_8bit():
+    assert convert_color((0.5, 255, 0)) == (0.5 / 255, 1., 0.)
+    assert_colors(create_colormap([(0.5, 255, 0), (1, 1, 1)]),
+                  [(0.5 / 255, 1., 0.), WHITE])
+
+
+def test_create_colormap_position():
+    cmap = create_colormap(['blue', 'white', 'red'], position=[10, 5, 0])
+    assert_colors(cmap, [RED, WHITE, BLUE])
+    cmap = create_colormap(['blue', 'white', 'red'], reverse=True)
+    assert_colors(cmap, [RED, WHITE, BLUE])
+
+
+@pytest.mark.parametrize('dtype, expected', [
+    (np.float32, np.float32),
+    (np.float64, np.float64),
+    (np.int64, np.float64),
+])
+def test_normalize_dtype(dtype, expected):
+    norm = normalize(np.array([2, 3, 4], dtype=dtype), 2, 4)
+    assert norm.dtype == expected
+    np.testing.assert_allclose(norm, [0., 0.5, 1.])
+
+
+def test_create_colormaps():
+    colors = [['blue', 'white', 'red'],
+              [(0, 0, 255), (255, 255, 255), (255, 0, 0)],
+              np.array([(0, 0, 255), (255, 255, 255), (255, 0, 0)])]
+    cmaps = create_colormaps(colors, position=[None, [0, 2, 10], None],
+                             reverse=True)
+    assert [cmap.name for cmap in cmaps] == [
+        'custom_colormap_0', 'custom_colormap_1', 'custom_colormap_2']
+    for cmap, palette, position in zip(cmaps, colors,
+                                       [None, [0, 2, 10], None]):
+        expected = create_colormap(palette, position=position, reverse=True)
+        np.testing.assert_allclose(cmap(np.linspace(0, 1, 11)),
+                                   expected(np.linspace(0, 1, 11)))
+    cmaps = create_colormaps([['blue', 'red']], name=['a'])
+    assert [cmap.name for cmap in cmaps] == ['a']
+    assert create_colormaps([]) == []
+    with pytest.raises(ValueError):
+        create_colormaps([['blue', 'red']], name=['a', 'b'])
+
+
+def test_matplotlib_attributes():
+    from custom_colormaps import ColorConverter, LinearSegmentedColormap
+    assert isinstance(create_colormap(['blue', 'red']),
+                      LinearSegmentedColormap)
+    assert ColorConverter.to_rgb('blue') == BLUE
+    with pytest.raises(AttributeError):
+        custom_colormaps.to_rgba_array
+
+
+def test_create_colormap_cache_isolated():
+    cmap = create_colormap(['blue', 'red'])
+    cmap._segmentdata['red'][0, 1] = 0.25
+    cmap = create_colormap(['blue', 'red'])
+    assert_colors(cmap, [BLUE, RED])
+
+
+def test_create_colormap_cache_object_array():
+    colors = np.empty(2, dtype=object)
+    colors[0] = [0, 0, 1]
+    colors[1] = [1, 0, 0]
+    assert_colors(create_colormap(colors), [BLUE, RED])
+    colors[0][1] = 1
+    colors[0][2] = 0
+    assert_colors(create_colormap(colors), [(0., 1., 0.), RED])
+
+
+def test_create_colormap_cache_keeps_no_arguments():
+    colors = np.array([(0., 0., 1.), (1., 0., 0.)])
+    position = np.array([0., 1.])
+    refs = [weakref.ref(colors), weakref.ref(position)]
+    create_colormap(colors, position=position)
+    del colors, position
+    assert all(ref() is None for ref in refs)
+
+
+def test_create_colormap_cache_size():
+    for k in range(custom_colormaps._COLORMAP_CACHE_SIZE + 10):
+        create_colormap([(0, 0, 1), (1, 0, 0)], name=f'cmap_{k}')
+    assert len(custom_colormaps._COLORMAP_CACHE) == \
+        custom_colormaps._COLORMAP_CACHE_SIZE
+
+
+def assert_breakpoints(cmap, x, start, stop):
+    """Check breakpoint positions and the start/stop color of each segment."""
+    for k, channel in enumerate(('red', 'green', 'blue')):
+        rows = np.asarray(cmap._segmentdata[channel])
+        np.testing.assert_allclose(rows[:, 0], x)
+        # the stop color of the first and start color of the last rows are
+        # never used
+        np.testing.assert_allclose(rows[:-1, 2], np.array(start)[:, k])
+        np.testing.assert_allclose(rows[1:, 1], np.array(stop)[:, k])
+
+
+def test_create_breakpoint_colormap():
+    cmap = create_breakpoint_colormap([('blue', 'white'), ('red', 'blue')])
+    assert_breakpoints(cmap, [0., 0.5, 1.], [BLUE, RED], [WHITE, BLUE])
+    cmap = create_breakpoint_colormap(np.array([['blue', 'white'],
+                                                ['red', 'blue']]),
+                                      position=[(0, 4), (4, 10)])
+    assert_breakpoints(cmap, [0., 0.4, 1.], [BLUE, RED], [WHITE, BLUE])
+    cmap = create_breakpoint_colormap(
+        np.array([[(0, 0, 255), (255, 255, 255)],
+                  [(255, 0, 0), (0, 0, 255)]]))
+    assert_breakpoints(cmap, [0., 0.5, 1.], [BLUE, RED], [WHITE, BLUE])